@@ -7,6 +7,7 @@ Usage:
     python3 tests/test_seo.py --live       # local + production
 """
 
+import os
 import re
 import json
 import sys
@@ -22,6 +23,10 @@ BOOKS = {
     "illusions-in-the-boardroom": {"title": "Illusions in the Boardroom", "chapters": 22},
 }
 
+TITLE_RE = re.compile(r"<title>(.*?)</title>")
+H1_RE = re.compile(r"<h1>(.*?)</h1>")
+JSON_LD_RE = re.compile(r'<script type="application/ld\+json">\s*(.*?)\s*</script>', re.DOTALL)
+
 
 class Results:
     def __init__(self):
@@ -54,37 +59,43 @@ def extract_meta(html, name):
 
 
 def extract_title(html):
-    m = re.search(r"<title>(.*?)</title>", html)
+    m = TITLE_RE.search(html)
     return m.group(1) if m else None
 
 
 def extract_h1(html):
-    m = re.search(r"<h1>(.*?)</h1>", html)
+    m = H1_RE.search(html)
     return m.group(1) if m else None
 
 
-def has_json_ld_field(html, schema_type, field):
-    """Check if a JSON-LD block of a given @type contains a field."""
-    for m in re.finditer(r'<script type="application/ld\+json">\s*(.*?)\s*</script>', html, re.DOTALL):
+def json_ld_blocks(html, schema_type):
+    """Yield parsed JSON-LD blocks of a given @type, skipping invalid JSON."""
+    for m in JSON_LD_RE.finditer(html):
         try:
             data = json.loads(m.group(1))
-            if data.get("@type") == schema_type and field in data:
-                return True
         except json.JSONDecodeError:
             continue
-    return False
+        if data.get("@type") == schema_type:
+            yield data
+
+
+def has_json_ld_field(html, schema_type, field):
+    """Check if a JSON-LD block of a given @type contains a field."""
+    return any(field in data for data in json_ld_blocks(html, schema_type))
 
 
 def has_json_ld_type(html, schema_type):
     """Check if a JSON-LD block of a given @type exists."""
-    for m in re.finditer(r'<script type="application/ld\+json">\s*(.*?)\s*</script>', html, re.DOTALL):
-        try:
-            data = json.loads(m.group(1))
-            if data.get("@type") == schema_type:
-                return True
-        except json.JSONDecodeError:
-            continue
-    return False
+    return any(True for _ in json_ld_blocks(html, schema_type))
+
+
+def list_chapter_dirs(book_dir):
+    """List chapter page directories in a single scandir pass."""
+    ch_dir = book_dir / "chapters"
+    if not ch_dir.exists():
+        return []
+    with os.scandir(ch_dir) as entries:
+        return [Path(e.path) for e in entries if e.is_dir()]
 
 
 # ---------------------------------------------------------------------------
@@ -123,6 +134,7 @@ def check_local(r):
     r.check("Sitemap: has 50+ URLs", url_count >= 50, f"{url_count}")
 
     # --- Per-book checks ---
+    chapters_by_book = {}
     for slug, info in BOOKS.items():
         book_dir = SITE_DIR / slug
         book_title = info["title"]
@@ -146,8 +158,7 @@ def check_local(r):
                     len(cdesc) <= 155, f"{len(cdesc)}")
 
         # Chapter pages
-        ch_dir = book_dir / "chapters"
-        chapter_dirs = [d for d in ch_dir.iterdir() if d.is_dir()] if ch_dir.exists() else []
+        chapter_dirs = chapters_by_book[slug] = list_chapter_dirs(book_dir)
         r.check(f"{slug} chapters: {expected_chapters} pages exist",
                 len(chapter_dirs) == expected_chapters,
                 f"found {len(chapter_dirs)}")
@@ -176,13 +187,8 @@ def check_local(r):
 
     # Check ALL chapter descriptions are <= 155
     over = []
-    for slug in BOOKS:
-        ch_dir = SITE_DIR / slug / "chapters"
-        if not ch_dir.exists():
-            continue
-        for ch_path in ch_dir.iterdir():
-            if not ch_path.is_dir():
-                continue
+    for slug, chapter_dirs in chapters_by_book.items():
+        for ch_path in chapter_dirs:
             ch_html = (ch_path / "index.html").read_text()
             d = extract_meta(ch_html, "description")
             if d and len(d) > 155: